@@ -1,107 +1,395 @@
 import sys
 import sqlite3
-from datetime import datetime
+import functools
+from datetime import datetime, date
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QCalendarWidget, QPushButton,
-    QLineEdit, QListWidget, QListWidgetItem, QWidget, QMessageBox, QLabel, QComboBox,
-    QInputDialog, QSizePolicy, QAction, QDialog, QFormLayout, QCheckBox, QDateEdit
+    QLineEdit, QListView, QWidget, QMessageBox, QLabel, QComboBox,
+    QInputDialog, QSizePolicy, QAction, QDialog, QFormLayout, QCheckBox, QDateEdit,
+    QStyledItemDelegate, QStyleOptionButton, QStyle
 )
-from PyQt5.QtGui import QIcon
-from PyQt5.QtCore import Qt, QDate, QSize
+from PyQt5.QtGui import QIcon, QStaticText
+from PyQt5.QtCore import (
+    Qt, QDate, QSize, QTimer, QRect, QEvent, QPointF, QAbstractListModel, QModelIndex,
+    QObject, QRunnable, QThreadPool, pyqtSignal
+)
+
+CATEGORIES = ['Work', 'Personal', 'Education', 'Important', 'Other']
 
-# Adapter & converter for DB (unified time format)
-def adapt_date(date):
-    return date.strftime("%Y-%m-%d").encode("utf-8")
+# Adapter & converter for DB (unified time format). We only ever store
+# YYYY-MM-DD, so isoformat/slicing beat the strftime/strptime format parsers
+# on the per-row hot path.
+def adapt_date(d):
+    # must stay str: a bytes bind becomes a BLOB, which never compares
+    # equal/greater against the TEXT dates already in the table
+    return d.isoformat()[:10]
 
 def convert_date(bytestring):
-    return datetime.strptime(bytestring.decode("utf-8"), "%Y-%m-%d")
+    # a plain date, not a midnight datetime: nothing downstream needs a time
+    # component and date construction is the cheaper of the two
+    return date(int(bytestring[:4]), int(bytestring[5:7]), int(bytestring[8:10]))
 
 sqlite3.register_adapter(datetime, adapt_date)
+sqlite3.register_adapter(date, adapt_date)
 sqlite3.register_converter("date", convert_date)
 
 # DB functions (sqlite)
+_CONN = None  # shared connection, opened once in initialize_db()
+
+def get_connection():
+    global _CONN
+    if _CONN is None:
+        # cached_statements keeps prepared plans for repeated query text, so
+        # the hot queries are parsed once per process rather than per call
+        _CONN = sqlite3.connect('calendar_data.db', detect_types=sqlite3.PARSE_DECLTYPES,
+                                check_same_thread=False, cached_statements=256)
+    return _CONN
+
 def execute_query(query, params=(), fetchone=False, commit=False):
     try:
-        with sqlite3.connect('calendar_data.db', detect_types=sqlite3.PARSE_DECLTYPES) as conn:
-            cursor = conn.cursor()
-            cursor.execute(query, params)
-            if commit:
-                conn.commit()
-            return cursor.fetchone() if fetchone else cursor.fetchall()
+        conn = get_connection()
+        cursor = conn.execute(query, params)
+        if commit:
+            conn.commit()
+        return cursor.fetchone() if fetchone else cursor.fetchall()
     except sqlite3.Error as e:
         print(f"Database error: {e}")
 
 def initialize_db():
+    conn = get_connection()
+    # WAL makes commits append-only log writes and lets readers run while
+    # a write is in flight; NORMAL sync halves the fsyncs per commit.
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA cache_size=-20000')
+    conn.execute('PRAGMA temp_store=MEMORY')
+    conn.execute('PRAGMA mmap_size=134217728')
     create_table_query = '''
     CREATE TABLE IF NOT EXISTS events (
         id INTEGER PRIMARY KEY,
         title TEXT NOT NULL,
         event_date DATE NOT NULL,
-        category TEXT
+        category TEXT,
+        title_lc TEXT GENERATED ALWAYS AS (lower(title)) VIRTUAL
     )
     '''
     execute_query(create_table_query, commit=True)
+    # upgrade path: databases created before title_lc existed
+    try:
+        conn.execute('ALTER TABLE events ADD COLUMN title_lc TEXT '
+                     'GENERATED ALWAYS AS (lower(title)) VIRTUAL')
+    except sqlite3.OperationalError:
+        pass  # column already present
+    # covering index: serves ORDER BY event_date (and date-range filters)
+    # straight from the index, no table scan or external sort
+    execute_query(
+        'CREATE INDEX IF NOT EXISTS idx_events_date ON events(event_date, title, category, id)',
+        commit=True
+    )
+    execute_query(
+        'CREATE INDEX IF NOT EXISTS idx_events_title_lc ON events(title_lc)',
+        commit=True
+    )
+
+# SQL kept as module-level constants: identical query text on every call
+# means deterministic hits in the connection's statement cache
+INSERT_EVENT_QUERY = 'INSERT INTO events (title, event_date, category) VALUES (?, ?, ?)'
+DELETE_EVENT_QUERY = 'DELETE FROM events WHERE id = ?'
+UPDATE_TITLE_QUERY = 'UPDATE events SET title = ? WHERE id = ?'
+
+def add_events(rows):
+    # bulk path: one transaction around executemany amortises the commit
+    # fsync over the whole batch
+    try:
+        conn = get_connection()
+        with conn:
+            conn.executemany(INSERT_EVENT_QUERY, rows)
+    except sqlite3.Error as e:
+        print(f"Database error: {e}")
 
 def add_event(title, event_date, category):
-    insert_query = '''
-    INSERT INTO events (title, event_date, category)
-    VALUES (?, ?, ?)
-    '''
-    execute_query(insert_query, (title, event_date, category), commit=True)
+    add_events([(title, event_date, category)])
 
 def remove_event(event_id):
-    delete_query = '''
-    DELETE FROM events WHERE id = ?
-    '''
-    execute_query(delete_query, (event_id,), commit=True)
+    execute_query(DELETE_EVENT_QUERY, (event_id,), commit=True)
 
 def update_event_title(event_id, new_title):
-    update_query = '''
-    UPDATE events
-    SET title = ?
-    WHERE id = ?
-    '''
-    execute_query(update_query, (new_title, event_id), commit=True)
+    execute_query(UPDATE_TITLE_QUERY, (new_title, event_id), commit=True)
 
 def get_events():
-    select_query = 'SELECT * FROM events ORDER BY event_date'
-    return execute_query(select_query)
+    return get_events_filtered()
+
+# few filter shapes exist, so cache the assembled SQL per shape and
+# let SQLite reuse the prepared statement for identical query text
+@functools.lru_cache(maxsize=64)
+def _filter_sql(has_search, has_category, has_from, has_to, keyset=False, limited=False):
+    clauses = []
+    if has_search:
+        clauses.append("title_lc LIKE ? ESCAPE '\\'")
+    if has_category:
+        clauses.append('category = ?')
+    if has_from:
+        clauses.append('event_date >= ?')
+    if has_to:
+        clauses.append('event_date <= ?')
+    if keyset:
+        # row-value comparison (SQLite >= 3.15): plans as an index SEARCH on
+        # idx_events_date, where the equivalent OR form degrades to a full
+        # index SCAN that discards every row before the key
+        clauses.append('(event_date, id) > (?, ?)')
+    query = 'SELECT id, title, event_date, category FROM events'
+    if clauses:
+        query += ' WHERE ' + ' AND '.join(clauses)
+    query += ' ORDER BY event_date, id'
+    if limited:
+        query += ' LIMIT ?'
+    return query
+
+def _filter_params(search, category, from_date, to_date):
+    # binds are positional, in the same order _filter_sql emits the clauses
+    params = []
+    if search:
+        escaped = search.replace('\\', '\\\\').replace('%', r'\%').replace('_', r'\_')
+        params.append(f'%{escaped}%')
+    if category is not None:
+        params.append(category)
+    if from_date is not None:
+        params.append(from_date)
+    if to_date is not None:
+        params.append(to_date)
+    return params
+
+def get_events_filtered(search=None, category=None, from_date=None, to_date=None):
+    # filtering happens in SQL so only matching rows cross into Python
+    query = _filter_sql(bool(search), category is not None,
+                        from_date is not None, to_date is not None)
+    return execute_query(query, tuple(_filter_params(search, category, from_date, to_date)))
+
+def get_events_page(search=None, category=None, from_date=None, to_date=None,
+                    after_date=None, after_id=None, limit=200):
+    # keyset pagination: the row-value comparison seeks to event_date >
+    # after_date in idx_events_date, so page cost tracks page size rather
+    # than how deep the page sits (a small temp B-tree still sorts each date
+    # group by id, since id is the fourth index column)
+    query = _filter_sql(bool(search), category is not None,
+                        from_date is not None, to_date is not None,
+                        keyset=after_date is not None, limited=True)
+    params = _filter_params(search, category, from_date, to_date)
+    if after_date is not None:
+        params += [after_date, after_id]
+    params.append(limit)
+    return execute_query(query, tuple(params))
+
+# date formatter (1 January, 2000), memoized per day since several events
+# usually share a date and strftime allocates a fresh string each call
+@functools.lru_cache(maxsize=4096)
+def _format_ordinal(ordinal):
+    return datetime.fromordinal(ordinal).strftime('%d %B, %Y')
 
-# date formatter (1 January, 2000)
 def format_date(date):
-    return date.strftime('%d %B, %Y')
+    return _format_ordinal(date.toordinal())
+
+# pre-laid-out row text: QStaticText caches the glyph layout, so repeated
+# paints of the same string skip font shaping entirely
+@functools.lru_cache(maxsize=4096)
+def _static_row_text(text):
+    return QStaticText(text)
+
+# item data roles for event rows (date headers carry no EVENT_ID_ROLE)
+EVENT_ID_ROLE = Qt.UserRole
+TITLE_ROLE = Qt.UserRole + 1
+CATEGORY_ROLE = Qt.UserRole + 2
+
+# event rows: one delegate paints every row instead of three QWidgets +
+# a layout per event, so row count no longer drives widget allocations
+class EventItemDelegate(QStyledItemDelegate):
+    BUTTON_WIDTH = 100
+    BUTTON_HEIGHT = 26
+    MARGIN = 6
+    ICON_SIZE = 16
+
+    def __init__(self, parent_app, category_icons=None):
+        super().__init__(parent_app)
+        self.parent_app = parent_app
+        self.category_icons = category_icons or {}
+
+    def _button_rects(self, rect):
+        # [Remove][Edit] right-aligned, same order as the old per-row buttons
+        y = rect.top() + (rect.height() - self.BUTTON_HEIGHT) // 2
+        edit = QRect(rect.right() - self.MARGIN - self.BUTTON_WIDTH, y,
+                     self.BUTTON_WIDTH, self.BUTTON_HEIGHT)
+        remove = QRect(edit.left() - self.MARGIN - self.BUTTON_WIDTH, y,
+                       self.BUTTON_WIDTH, self.BUTTON_HEIGHT)
+        return remove, edit
+
+    def paint(self, painter, option, index):
+        event_id = index.data(EVENT_ID_ROLE)
+        if event_id is None:  # date header row
+            super().paint(painter, option, index)
+            return
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawPrimitive(QStyle.PE_PanelItemViewItem, option, painter, option.widget)
+
+        remove_rect, edit_rect = self._button_rects(option.rect)
+        title, category = index.data(TITLE_ROLE), index.data(CATEGORY_ROLE)
+
+        text_x = option.rect.left() + self.MARGIN
+        icon = self.category_icons.get(category)
+        if icon is not None and not icon.isNull():
+            icon_y = option.rect.top() + (option.rect.height() - self.ICON_SIZE) // 2
+            icon.paint(painter, QRect(text_x, icon_y, self.ICON_SIZE, self.ICON_SIZE))
+            text_x += self.ICON_SIZE + self.MARGIN
+
+        static_text = _static_row_text(f"{title} ({category})")
+        text_y = option.rect.top() + (option.rect.height() - static_text.size().height()) / 2
+        # clip so a long title cannot paint underneath the buttons; clipping
+        # (rather than eliding) keeps the cached QStaticText layout intact
+        painter.save()
+        painter.setClipRect(QRect(text_x, option.rect.top(),
+                                  remove_rect.left() - self.MARGIN - text_x,
+                                  option.rect.height()))
+        painter.drawStaticText(QPointF(text_x, text_y), static_text)
+        painter.restore()
+
+        for rect, text in ((remove_rect, 'Remove'), (edit_rect, 'Edit')):
+            button = QStyleOptionButton()
+            button.rect = rect
+            button.text = text
+            button.state = QStyle.State_Enabled
+            style.drawControl(QStyle.CE_PushButton, button, painter, option.widget)
+
+    def sizeHint(self, option, index):
+        size = super().sizeHint(option, index)
+        if index.data(EVENT_ID_ROLE) is not None:
+            size.setHeight(max(size.height(), self.BUTTON_HEIGHT + 2 * self.MARGIN))
+        return size
+
+    def editorEvent(self, event, model, option, index):
+        event_id = index.data(EVENT_ID_ROLE)
+        # left release only, matching the QPushButtons these rects replaced
+        if (event_id is not None and event.type() == QEvent.MouseButtonRelease
+                and event.button() == Qt.LeftButton):
+            remove_rect, edit_rect = self._button_rects(option.rect)
+            if remove_rect.contains(event.pos()):
+                self.parent_app.remove_event(event_id)
+                return True
+            if edit_rect.contains(event.pos()):
+                self.parent_app.edit_event(event_id, index.data(TITLE_ROLE))
+                return True
+        return super().editorEvent(event, model, option, index)
+
+class _QueryJobSignals(QObject):
+    finished = pyqtSignal(int, list)
+
+# one page query on the global thread pool; the result comes back on the
+# GUI thread via the finished signal, tagged with the generation token it
+# was started under so stale pages can be dropped
+class _QueryJob(QRunnable):
+    def __init__(self, token, query_kwargs):
+        super().__init__()
+        self.token = token
+        self.query_kwargs = query_kwargs
+        self.signals = _QueryJobSignals()
 
-# event manager
-class EventWidget(QWidget):
-    def __init__(self, event_title, event_id, category, parent=None):
-        super().__init__(parent)
-        self.event_title = event_title
-        self.event_id = event_id
-        self.category = category
-        self.parent_app = parent
-        
-        layout = QHBoxLayout()
-        layout.addWidget(QLabel(f"{event_title} ({category})"))
-        
-        for text, slot in [('Remove', self.remove_event), ('Edit', self.edit_event)]:
-            button = QPushButton(text)
-            button.setFixedWidth(100)
-            button.clicked.connect(slot)
-            layout.addWidget(button)
-        
-        self.setLayout(layout)
-        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)  # Expand horizontally, like our to-do list
+    def run(self):
+        rows = get_events_page(**self.query_kwargs) or []
+        self.signals.finished.emit(self.token, rows)
 
-    def edit_event(self):
-        new_title, ok = QInputDialog.getText(self, 'Edit Event', 'New title:', text=self.event_title)
-        if ok and new_title:
-            update_event_title(self.event_id, new_title)
-            self.parent_app.refresh_events()
+# lazily-loaded event list: rows arrive in keyset-paginated chunks, so a
+# refresh touches one page of the table instead of every row
+class EventListModel(QAbstractListModel):
+    PAGE_SIZE = 200
 
-    def remove_event(self):
-        if QMessageBox.question(self, 'Confirm Removal', 'Are you sure you want to remove this event?', QMessageBox.Yes | QMessageBox.No) == QMessageBox.Yes:
-            remove_event(self.event_id)
-            self.parent_app.refresh_events()
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []        # (event_id, title, category); headers use (None, date_str, None)
+        self._filters = {}
+        self._last_key = None  # (event_date, id) of the last fetched event
+        self._last_header = None
+        self._exhausted = False
+        self._generation = 0   # bumped on every filter change to cancel in-flight pages
+        self._fetching = False
+
+    def set_filters(self, search=None, category=None, from_date=None, to_date=None):
+        self.beginResetModel()
+        self._filters = {'search': search, 'category': category,
+                         'from_date': from_date, 'to_date': to_date}
+        self._rows = []
+        self._last_key = None
+        self._last_header = None
+        self._exhausted = False
+        self._generation += 1
+        self._fetching = False
+        self.endResetModel()
+
+    def refresh(self):
+        # reload under whatever filters are active (search or advanced)
+        self.set_filters(**self._filters)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        event_id, title, category = self._rows[index.row()]
+        if role == EVENT_ID_ROLE:
+            return event_id
+        if role == TITLE_ROLE:
+            return title
+        if role == CATEGORY_ROLE:
+            return category
+        if role == Qt.DisplayRole and event_id is None:
+            return title  # date header text; event rows are painted by the delegate
+        return None
+
+    def flags(self, index):
+        if index.isValid() and self._rows[index.row()][0] is None:
+            return Qt.ItemIsEnabled  # headers are not selectable
+        return super().flags(index)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        # the query runs on the thread pool so typing never blocks on SQL;
+        # the page is applied by _apply_page when the job's signal fires
+        if parent.isValid() or self._exhausted or self._fetching:
+            return
+        self._fetching = True
+        after_date, after_id = self._last_key if self._last_key else (None, None)
+        job = _QueryJob(self._generation,
+                        dict(after_date=after_date, after_id=after_id,
+                             limit=self.PAGE_SIZE, **self._filters))
+        job.signals.finished.connect(self._apply_page)
+        QThreadPool.globalInstance().start(job)
+
+    def _apply_page(self, token, events):
+        if token != self._generation:
+            return  # filters changed while the query ran; page is stale
+        self._fetching = False
+        if len(events) < self.PAGE_SIZE:
+            self._exhausted = True
+        if not events:
+            return
+
+        # rows already arrive sorted by (event_date, id), so emit a header on
+        # each date transition in one pass -- no intermediate grouping dict
+        new_rows = []
+        prev = self._last_header
+        for event_id, event_title, event_date, category in events:
+            date_str = format_date(event_date)
+            if date_str != prev:
+                new_rows.append((None, date_str, None))
+                prev = date_str
+            new_rows.append((event_id, event_title, category))
+        self._last_header = prev
+        self._last_key = (event_date, event_id)  # key of the last row in the page
+
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(new_rows) - 1)
+        self._rows.extend(new_rows)
+        self.endInsertRows()
 
 # class for handling Advanced Searches
 class AdvancedSearchDialog(QDialog):
@@ -113,7 +401,7 @@ class AdvancedSearchDialog(QDialog):
 
         self.category_checkbox = QCheckBox('Category')
         self.category_input = QComboBox()
-        self.category_input.addItems(['Work', 'Personal', 'Education', 'Important', 'Other'])
+        self.category_input.addItems(CATEGORIES)
 
         self.date_range_checkbox = QCheckBox('Date Range')
         self.from_date_input = QDateEdit(calendarPopup=True)
@@ -166,18 +454,29 @@ class CalendarApp(QMainWindow):
         self.event_input.setPlaceholderText('Event title')
 
         self.category_input = QComboBox(self)
-        self.category_input.addItems(['Work', 'Personal', 'Education', 'Important', 'Other'])
+        self.category_input.addItems(CATEGORIES)
 
         self.search_input = QLineEdit(self)
         self.search_input.setPlaceholderText('Search events...')
-        self.search_input.textChanged.connect(self.refresh_events)
+
+        # debounce: coalesce a burst of keystrokes into one refresh
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self.refresh_events)
+        self.search_input.textChanged.connect(self._search_timer.start)
 
         self.add_event_button = QPushButton('Add Event', self)
         self.add_event_button.setFixedWidth(120)
         self.add_event_button.clicked.connect(self.add_event)
 
-        self.events_list = QListWidget(self)
+        self.events_list = QListView(self)
         self.events_list.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)  # fix for proper window size
+        self._events_model = EventListModel(self)
+        self.events_list.setModel(self._events_model)
+        # category icons loaded once, not per row (missing files -> null icon)
+        self._cat_icons = {c: QIcon(f'icons/{c.lower()}.png') for c in CATEGORIES}
+        self.events_list.setItemDelegate(EventItemDelegate(self, self._cat_icons))
 
         # better horizontal layout for button and input box
         input_layout = QHBoxLayout()
@@ -202,7 +501,7 @@ class CalendarApp(QMainWindow):
         self.toolbar.setIconSize(QSize(20, 20))
 
         refresh_action = QAction(QIcon('icons/refresh.png'), 'Refresh', self)
-        refresh_action.triggered.connect(self.refresh_events)
+        refresh_action.triggered.connect(self.reload_events)
         self.toolbar.addAction(refresh_action)
 
         advanced_search_action = QAction(QIcon('icons/search.png'), 'Advanced Search', self)
@@ -241,30 +540,20 @@ class CalendarApp(QMainWindow):
             self.apply_advanced_search(dialog.filters)
 
     def apply_advanced_search(self, filters):
-        events = get_events()
-        self.events_list.clear()
-        grouped_events = {}
-
-        for event in events:
-            event_title, event_date, category = event[1].lower(), event[2].date(), event[3]
-            if 'category' in filters and filters['category'] != category:
-                continue
-            if 'from_date' in filters and event_date < filters['from_date']:
-                continue
-            if 'to_date' in filters and event_date > filters['to_date']:
-                continue
-            event_date_str = format_date(event[2])
-            grouped_events.setdefault(event_date_str, []).append((event_title, event[0], category))
-
-        for date, titles in grouped_events.items():
-            date_item = QListWidgetItem(date)
-            date_item.setFlags(date_item.flags() & ~Qt.ItemIsSelectable)
-            self.events_list.addItem(date_item)
-            for title, event_id, category in titles:
-                event_widget = EventWidget(title, event_id, category, self)
-                item = QListWidgetItem(self.events_list)
-                item.setSizeHint(event_widget.sizeHint())
-                self.events_list.setItemWidget(item, event_widget)
+        self._events_model.set_filters(category=filters.get('category'),
+                                       from_date=filters.get('from_date'),
+                                       to_date=filters.get('to_date'))
+
+    def edit_event(self, event_id, current_title):
+        new_title, ok = QInputDialog.getText(self, 'Edit Event', 'New title:', text=current_title)
+        if ok and new_title:
+            update_event_title(event_id, new_title)
+            self.reload_events()
+
+    def remove_event(self, event_id):
+        if QMessageBox.question(self, 'Confirm Removal', 'Are you sure you want to remove this event?', QMessageBox.Yes | QMessageBox.No) == QMessageBox.Yes:
+            remove_event(event_id)
+            self.reload_events()
 
     def date_selected(self, date):
         self.selected_date = date
@@ -278,34 +567,18 @@ class CalendarApp(QMainWindow):
             add_event(title, event_date, category)
             self.event_input.clear()
             QMessageBox.information(self, 'Success', 'Event added successfully!')
-            self.refresh_events()
+            self.reload_events()
         else:
             QMessageBox.warning(self, 'Error', 'Event title is required!')
 
     def refresh_events(self):
         search_text = self.search_input.text().lower()
-        events = get_events()
-
-        self.events_list.clear()
-        grouped_events = {}
-
-        for event in events:
-            try:
-                event_title, event_date, category = event[1].lower(), format_date(event[2]), event[3]
-                if search_text in event_title:
-                    grouped_events.setdefault(event_date, []).append((event_title, event[0], category))
-            except IndexError as e:
-                print(f"Error processing event {event}: {e}")
-
-        for date, titles in grouped_events.items():
-            date_item = QListWidgetItem(date)
-            date_item.setFlags(date_item.flags() & ~Qt.ItemIsSelectable)
-            self.events_list.addItem(date_item)
-            for title, event_id, category in titles:
-                event_widget = EventWidget(title, event_id, category, self)
-                item = QListWidgetItem(self.events_list)
-                item.setSizeHint(event_widget.sizeHint())
-                self.events_list.setItemWidget(item, event_widget)
+        self._events_model.set_filters(search=search_text)
+
+    def reload_events(self):
+        # data changed but the view of it should not: re-run the active
+        # filters rather than resetting an advanced search to search-only
+        self._events_model.refresh()
 
 # main entry point
 if __name__ == '__main__':